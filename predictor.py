@@ -1,203 +1,303 @@
-#!/usr/bin/env python3
-# -*- coding: utf-8 -*-
-"""
-KB Reflex - 투자 심리 분석 예측 모듈
-실시간 투자 심리 패턴 분류를 위한 BERT 기반 예측 엔진
-"""
-
-import os
-import json
-import torch
-import numpy as np
-from typing import Dict, Optional
-from transformers import AutoTokenizer, AutoModelForSequenceClassification
-import torch.nn.functional as F
-
-
-class SentimentPredictor:
-    """
-    훈련된 BERT 모델을 사용하여 투자 심리 패턴을 예측하는 클래스
-    
-    이 클래스는 사용자의 투자 메모 텍스트를 분석하여 다음과 같은 심리 패턴을 분류합니다:
-    - 공포매도, 추격매수, 과신, 손실회피 등
-    """
-    
-    def __init__(self, model_path: str):
-        """
-        예측 모델 초기화
-        
-        Args:
-            model_path (str): 훈련된 모델이 저장된 디렉토리 경로
-        """
-        self.model_path = model_path
-        self.device = torch.device('cuda' if torch.cuda.is_available() else 'cpu')
-        
-        print(f"🤖 KB Reflex AI 엔진 로딩 중... (Device: {self.device})")
-        
-        # 모델 정보 로드
-        self._load_model_info()
-        
-        # 토크나이저 로드
-        self.tokenizer = AutoTokenizer.from_pretrained(model_path)
-        
-        # 모델 로드
-        self.model = AutoModelForSequenceClassification.from_pretrained(model_path)
-        self.model.to(self.device)
-        self.model.eval()  # 평가 모드로 설정
-        
-        print(f"✅ AI 엔진 로드 완료 (클래스 수: {len(self.id_to_label)})")
-        
-        # 각 감정 패턴에 대한 설명 정의
-        self._define_pattern_descriptions()
-    
-    def _load_model_info(self):
-        """모델 정보 및 라벨 매핑 로드"""
-        model_info_path = os.path.join(self.model_path, 'model_info.json')
-        
-        if not os.path.exists(model_info_path):
-            raise FileNotFoundError(f"모델 정보 파일을 찾을 수 없습니다: {model_info_path}")
-        
-        with open(model_info_path, 'r', encoding='utf-8') as f:
-            model_info = json.load(f)
-        
-        # 문자열 키를 정수로 변환
-        self.id_to_label = {int(k): v for k, v in model_info['id_to_label'].items()}
-        self.label_to_id = model_info['label_to_id']
-        self.num_labels = model_info['num_labels']
-    
-    def _define_pattern_descriptions(self):
-        """각 투자 심리 패턴에 대한 설명 정의"""
-        self.pattern_descriptions = {
-            '공포': '시장 하락이나 손실에 대한 두려움으로 인한 급작스러운 매도 행동입니다. 감정적 결정으로 이어질 수 있어 주의가 필요합니다.',
-            '추격매수': '주가 상승을 보고 기회를 놓칠까 두려워 서둘러 매수하는 FOMO(Fear of Missing Out) 심리입니다.',
-            '과신': '과거의 성공 경험을 바탕으로 과도한 자신감을 보이는 패턴입니다. 위험 관리에 소홀해질 수 있습니다.',
-            '손실회피': '손실을 확정하기 싫어하여 손절을 지연시키거나 피하려는 심리입니다.',
-            '확증편향': '자신의 판단을 뒷받침하는 정보만 선택적으로 수집하려는 경향입니다.',
-            '군중심리': '다른 투자자들의 행동을 따라하려는 경향으로, 독립적 사고가 부족할 때 나타납니다.',
-            '냉정': '감정에 휘둘리지 않고 합리적으로 투자 결정을 내리는 이상적인 상태입니다.'
-        }
-    
-    def _get_pattern_description(self, pattern: str) -> str:
-        """패턴에 대한 설명 반환"""
-        return self.pattern_descriptions.get(pattern, '분석된 투자 심리 패턴입니다.')
-    
-    def _get_confidence_level(self, confidence: float) -> str:
-        """신뢰도 레벨 텍스트 반환"""
-        if confidence >= 0.9:
-            return "매우 높음"
-        elif confidence >= 0.7:
-            return "높음"
-        elif confidence >= 0.5:
-            return "보통"
-        else:
-            return "낮음"
-    
-    def predict(self, text: str) -> Dict:
-        """
-        입력 텍스트의 투자 심리 패턴 예측
-        
-        Args:
-            text (str): 분석할 투자 메모 텍스트
-            
-        Returns:
-            Dict: 예측 결과 딕셔너리
-                - pattern (str): 예측된 심리 패턴
-                - confidence (float): 예측 신뢰도 (0-1)
-                - confidence_level (str): 신뢰도 레벨 ("높음", "보통", "낮음")
-                - description (str): 패턴에 대한 설명
-                - all_probabilities (dict): 모든 클래스별 확률
-        """
-        if not text or not text.strip():
-            return {
-                'pattern': '분석불가',
-                'confidence': 0.0,
-                'confidence_level': '없음',
-                'description': '분석할 텍스트가 없습니다.',
-                'all_probabilities': {}
-            }
-        
-        try:
-            # 텍스트 토크나이징
-            inputs = self.tokenizer(
-                text,
-                truncation=True,
-                padding='max_length',
-                max_length=128,
-                return_tensors='pt'
-            )
-            
-            # GPU가 사용 가능한 경우 입력 텐서를 GPU로 이동
-            inputs = {k: v.to(self.device) for k, v in inputs.items()}
-            
-            # 모델 추론
-            with torch.no_grad():
-                outputs = self.model(**inputs)
-                logits = outputs.logits
-            
-            # 소프트맥스를 적용하여 확률 계산
-            probabilities = F.softmax(logits, dim=-1)
-            probabilities = probabilities.cpu().numpy()[0]  # CPU로 이동 후 numpy 배열로 변환
-            
-            # 가장 높은 확률의 클래스 찾기
-            predicted_class_id = np.argmax(probabilities)
-            predicted_pattern = self.id_to_label[predicted_class_id]
-            confidence = float(probabilities[predicted_class_id])
-            
-            # 모든 클래스별 확률 딕셔너리 생성
-            all_probabilities = {
-                self.id_to_label[i]: float(prob) 
-                for i, prob in enumerate(probabilities)
-            }
-            
-            # 결과 딕셔너리 생성
-            result = {
-                'pattern': predicted_pattern,
-                'confidence': round(confidence, 3),
-                'confidence_level': self._get_confidence_level(confidence),
-                'description': self._get_pattern_description(predicted_pattern),
-                'all_probabilities': all_probabilities
-            }
-            
-            return result
-            
-        except Exception as e:
-            print(f"❌ 예측 중 오류 발생: {str(e)}")
-            return {
-                'pattern': '오류',
-                'confidence': 0.0,
-                'confidence_level': '없음',
-                'description': f'분석 중 오류가 발생했습니다: {str(e)}',
-                'all_probabilities': {}
-            }
-    
-    def predict_batch(self, texts: list) -> list:
-        """
-        여러 텍스트를 배치로 예측
-        
-        Args:
-            texts (list): 분석할 텍스트 리스트
-            
-        Returns:
-            list: 각 텍스트에 대한 예측 결과 리스트
-        """
-        results = []
-        for text in texts:
-            result = self.predict(text)
-            results.append(result)
-        return results
-    
-    def get_model_info(self) -> Dict:
-        """
-        모델 정보 반환
-        
-        Returns:
-            Dict: 모델 정보 딕셔너리
-        """
-        return {
-            'model_path': self.model_path,
-            'device': str(self.device),
-            'num_labels': self.num_labels,
-            'label_to_id': self.label_to_id,
-            'id_to_label': self.id_to_label,
-            'available_patterns': list(self.pattern_descriptions.keys())
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+KB Reflex - 투자 심리 분석 예측 모듈
+실시간 투자 심리 패턴 분류를 위한 BERT 기반 예측 엔진
+"""
+
+import os
+import json
+import torch
+import numpy as np
+from functools import lru_cache
+from typing import Dict, Optional
+from transformers import AutoTokenizer, AutoModelForSequenceClassification
+import torch.nn.functional as F
+
+
+# 동일한 메모에 대한 예측 결과 캐시 크기
+PREDICTION_CACHE_SIZE = 512
+
+# 배치 예측 시 한 번에 모델에 넣을 텍스트 수
+BATCH_SIZE = 32
+
+# 토크나이징 최대 길이 (어텐션 비용 상한)
+MAX_SEQ_LENGTH = 128
+
+# 예측 결과에 포함할 상위 패턴 수
+TOP_K_PATTERNS = 3
+
+# CPU 추론 시 Linear 레이어를 INT8 동적 양자화할지 여부
+QUANTIZE_ON_CPU = True
+
+
+class SentimentPredictor:
+    """
+    훈련된 BERT 모델을 사용하여 투자 심리 패턴을 예측하는 클래스
+    
+    이 클래스는 사용자의 투자 메모 텍스트를 분석하여 다음과 같은 심리 패턴을 분류합니다:
+    - 공포매도, 추격매수, 과신, 손실회피 등
+    """
+    
+    def __init__(self, model_path: str):
+        """
+        예측 모델 초기화
+        
+        Args:
+            model_path (str): 훈련된 모델이 저장된 디렉토리 경로
+        """
+        self.model_path = model_path
+        self.device = torch.device('cuda' if torch.cuda.is_available() else 'cpu')
+        
+        print(f"🤖 KB Reflex AI 엔진 로딩 중... (Device: {self.device})")
+        
+        # 모델 정보 로드
+        self._load_model_info()
+        
+        # 토크나이저 로드 (Rust 기반 fast 토크나이저 사용)
+        self.tokenizer = AutoTokenizer.from_pretrained(model_path, use_fast=True)
+        
+        # 모델 로드 (GPU에서는 fp16 가중치로 메모리·추론 시간 절감, CPU는 fp32 유지)
+        self.dtype = torch.float16 if self.device.type == 'cuda' else torch.float32
+        self.model = AutoModelForSequenceClassification.from_pretrained(model_path, torch_dtype=self.dtype)
+        self.model.to(self.device)
+        self.model.eval()  # 평가 모드로 설정
+        
+        # CPU에서는 Linear 가중치를 INT8로 동적 양자화해 메모리와 추론 시간 절감
+        self.quantized = QUANTIZE_ON_CPU and self.device.type == 'cpu'
+        if self.quantized:
+            self.model = torch.quantization.quantize_dynamic(
+                self.model, {torch.nn.Linear}, dtype=torch.qint8
+            )
+        
+        print(f"✅ AI 엔진 로드 완료 (클래스 수: {len(self.id_to_label)})")
+        
+        # 각 감정 패턴에 대한 설명 정의
+        self._define_pattern_descriptions()
+        
+        # 같은 텍스트를 다시 분석할 때 모델 추론을 건너뛰도록 인스턴스별 결과 캐시
+        self._cached_predict = lru_cache(maxsize=PREDICTION_CACHE_SIZE)(self._predict_uncached)
+        
+        # 첫 사용자 요청에서 지연이 생기지 않도록 로딩 시점에 한 번 추론 실행
+        self._warmup()
+    
+    def _warmup(self):
+        """더미 입력으로 한 번 추론하여 초기화 비용을 로딩 단계에서 처리"""
+        inputs = self.tokenizer("워밍업", truncation=True, max_length=MAX_SEQ_LENGTH, return_tensors='pt')
+        inputs = {k: v.to(self.device) for k, v in inputs.items()}
+        with torch.inference_mode():
+            self.model(**inputs)
+    
+    def _load_model_info(self):
+        """모델 정보 및 라벨 매핑 로드"""
+        model_info_path = os.path.join(self.model_path, 'model_info.json')
+        
+        if not os.path.exists(model_info_path):
+            raise FileNotFoundError(f"모델 정보 파일을 찾을 수 없습니다: {model_info_path}")
+        
+        with open(model_info_path, 'r', encoding='utf-8') as f:
+            model_info = json.load(f)
+        
+        # 문자열 키를 정수로 변환
+        self.id_to_label = {int(k): v for k, v in model_info['id_to_label'].items()}
+        self.label_to_id = model_info['label_to_id']
+        self.num_labels = model_info['num_labels']
+    
+    def _define_pattern_descriptions(self):
+        """각 투자 심리 패턴에 대한 설명 정의"""
+        self.pattern_descriptions = {
+            '공포': '시장 하락이나 손실에 대한 두려움으로 인한 급작스러운 매도 행동입니다. 감정적 결정으로 이어질 수 있어 주의가 필요합니다.',
+            '추격매수': '주가 상승을 보고 기회를 놓칠까 두려워 서둘러 매수하는 FOMO(Fear of Missing Out) 심리입니다.',
+            '과신': '과거의 성공 경험을 바탕으로 과도한 자신감을 보이는 패턴입니다. 위험 관리에 소홀해질 수 있습니다.',
+            '손실회피': '손실을 확정하기 싫어하여 손절을 지연시키거나 피하려는 심리입니다.',
+            '확증편향': '자신의 판단을 뒷받침하는 정보만 선택적으로 수집하려는 경향입니다.',
+            '군중심리': '다른 투자자들의 행동을 따라하려는 경향으로, 독립적 사고가 부족할 때 나타납니다.',
+            '냉정': '감정에 휘둘리지 않고 합리적으로 투자 결정을 내리는 이상적인 상태입니다.'
+        }
+    
+    def _get_pattern_description(self, pattern: str) -> str:
+        """패턴에 대한 설명 반환"""
+        return self.pattern_descriptions.get(pattern, '분석된 투자 심리 패턴입니다.')
+    
+    def _get_confidence_level(self, confidence: float) -> str:
+        """신뢰도 레벨 텍스트 반환"""
+        if confidence >= 0.9:
+            return "매우 높음"
+        elif confidence >= 0.7:
+            return "높음"
+        elif confidence >= 0.5:
+            return "보통"
+        else:
+            return "낮음"
+    
+    def predict(self, text: str) -> Dict:
+        """
+        입력 텍스트의 투자 심리 패턴 예측
+        
+        Args:
+            text (str): 분석할 투자 메모 텍스트
+            
+        Returns:
+            Dict: 예측 결과 딕셔너리
+                - pattern (str): 예측된 심리 패턴
+                - confidence (float): 예측 신뢰도 (0-1)
+                - confidence_level (str): 신뢰도 레벨 ("높음", "보통", "낮음")
+                - description (str): 패턴에 대한 설명
+                - all_probabilities (dict): 모든 클래스별 확률
+                - top_patterns (list): 확률 상위 패턴 (패턴, 확률) 목록
+        """
+        if not text or not text.strip():
+            return {
+                'pattern': '분석불가',
+                'confidence': 0.0,
+                'confidence_level': '없음',
+                'description': '분석할 텍스트가 없습니다.',
+                'all_probabilities': {},
+                'top_patterns': []
+            }
+        
+        try:
+            # 캐시된 결과는 호출자가 수정해도 영향이 없도록 복사본 반환
+            result = self._cached_predict(text)
+            return {
+                **result,
+                'all_probabilities': dict(result['all_probabilities']),
+                'top_patterns': list(result['top_patterns'])
+            }
+            
+        except Exception as e:
+            print(f"❌ 예측 중 오류 발생: {str(e)}")
+            return {
+                'pattern': '오류',
+                'confidence': 0.0,
+                'confidence_level': '없음',
+                'description': f'분석 중 오류가 발생했습니다: {str(e)}',
+                'all_probabilities': {},
+                'top_patterns': []
+            }
+    
+    def _predict_uncached(self, text: str) -> Dict:
+        """모델 추론 수행 (예외는 캐시되지 않도록 그대로 전달)"""
+        # 텍스트 토크나이징
+        inputs = self.tokenizer(
+            text,
+            truncation=True,
+            padding='longest',  # 단건은 패딩 없이 실제 길이만큼만 추론
+            max_length=MAX_SEQ_LENGTH,
+            return_tensors='pt'
+        )
+        
+        # GPU가 사용 가능한 경우 입력 텐서를 GPU로 이동
+        inputs = {k: v.to(self.device) for k, v in inputs.items()}
+        
+        # 모델 추론 (inference_mode는 no_grad보다 autograd 추적 비용이 적음)
+        with torch.inference_mode():
+            outputs = self.model(**inputs)
+            logits = outputs.logits
+        
+        # 소프트맥스를 적용하여 확률 계산 (fp16 로짓도 fp32로 계산)
+        probabilities = F.softmax(logits.float(), dim=-1)
+        probabilities = probabilities.cpu().numpy()[0]  # CPU로 이동 후 numpy 배열로 변환
+        
+        return self._build_result(probabilities)
+    
+    def _build_result(self, probabilities: np.ndarray) -> Dict:
+        """클래스별 확률 배열로부터 예측 결과 딕셔너리 생성"""
+        # 가장 높은 확률의 클래스 찾기
+        predicted_class_id = int(np.argmax(probabilities))
+        predicted_pattern = self.id_to_label[predicted_class_id]
+        confidence = float(probabilities[predicted_class_id])
+        
+        # 모든 클래스별 확률 딕셔너리 생성
+        all_probabilities = {
+            self.id_to_label[i]: float(prob) 
+            for i, prob in enumerate(probabilities)
+        }
+        
+        # 상위 k개 패턴만 부분 선택(argpartition)한 뒤 확률 순으로 정렬
+        k = min(TOP_K_PATTERNS, probabilities.shape[0])
+        top_ids = np.argpartition(probabilities, -k)[-k:]
+        top_ids = top_ids[np.argsort(probabilities[top_ids])[::-1]]
+        top_patterns = [(self.id_to_label[int(i)], float(probabilities[i])) for i in top_ids]
+        
+        # 결과 딕셔너리 생성
+        result = {
+            'pattern': predicted_pattern,
+            'confidence': round(confidence, 3),
+            'confidence_level': self._get_confidence_level(confidence),
+            'description': self._get_pattern_description(predicted_pattern),
+            'all_probabilities': all_probabilities,
+            'top_patterns': top_patterns
+        }
+        
+        return result
+    
+    def predict_batch(self, texts: list, batch_size: int = BATCH_SIZE) -> list:
+        """
+        여러 텍스트를 배치로 예측
+        
+        텍스트를 건별로 추론하지 않고 batch_size 단위로 묶어
+        한 번의 토크나이징·모델 호출로 처리합니다.
+        
+        Args:
+            texts (list): 분석할 텍스트 리스트
+            batch_size (int): 한 번에 추론할 텍스트 수
+            
+        Returns:
+            list: 각 텍스트에 대한 예측 결과 리스트
+        """
+        results = [None] * len(texts)
+        
+        # 빈 텍스트는 기존 predict의 '분석불가' 결과 사용
+        valid_indices = []
+        for i, text in enumerate(texts):
+            if not text or not text.strip():
+                results[i] = self.predict(text)
+            else:
+                valid_indices.append(i)
+        
+        for start in range(0, len(valid_indices), batch_size):
+            chunk = valid_indices[start:start + batch_size]
+            chunk_texts = [texts[i] for i in chunk]
+            
+            try:
+                inputs = self.tokenizer(
+                    chunk_texts,
+                    truncation=True,
+                    padding=True,  # 배치 내 최장 길이에 맞춰 패딩
+                    max_length=MAX_SEQ_LENGTH,
+                    return_tensors='pt'
+                )
+                inputs = {k: v.to(self.device) for k, v in inputs.items()}
+                
+                with torch.inference_mode():
+                    logits = self.model(**inputs).logits
+                
+                probabilities = F.softmax(logits.float(), dim=-1).cpu().numpy()
+                for i, row in zip(chunk, probabilities):
+                    results[i] = self._build_result(row)
+                    
+            except Exception as e:
+                # 배치 추론 실패 시 건별 예측으로 대체 (개별 오류 처리)
+                print(f"⚠️ 배치 예측 실패, 건별 예측으로 전환: {str(e)}")
+                for i in chunk:
+                    results[i] = self.predict(texts[i])
+        
+        return results
+    
+    def get_model_info(self) -> Dict:
+        """
+        모델 정보 반환
+        
+        Returns:
+            Dict: 모델 정보 딕셔너리
+        """
+        return {
+            'model_path': self.model_path,
+            'device': str(self.device),
+            'quantized': self.quantized,
+            'num_labels': self.num_labels,
+            'label_to_id': self.label_to_id,
+            'id_to_label': self.id_to_label,
+            'available_patterns': list(self.pattern_descriptions.keys())
         }
\ No newline at end of file